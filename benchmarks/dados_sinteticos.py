@@ -0,0 +1,113 @@
+# =======================================================================
+# GERAÇÃO DE UM CADASTRO MUNICIPAL SINTÉTICO (REPRODUTÍVEL POR SEMENTE)
+# =======================================================================
+
+import csv
+import random
+
+# Padrões construtivos (descrição, valor do m²) e frequência relativa
+PADROES = [
+    ('Alvenaria simples', 900.0, 45),
+    ('Alvenaria padrão', 1400.0, 30),
+    ('Madeira', 600.0, 12),
+    ('Misto', 800.0, 9),
+    ('Alto padrão', 2500.0, 4),
+]
+# Usos (tipo, alíquota) e frequência relativa
+USOS = [
+    ('Residencial', 0.006, 80),
+    ('Comercial', 0.012, 12),
+    ('Misto', 0.009, 5),
+    ('Institucional', 0.004, 3),
+]
+TIPOS_REURB = [('REURB-S', 85), ('REURB-E', 15)]
+NOMES = ['Maria', 'José', 'Ana', 'João', 'Antônio', 'Francisca', 'Carlos', 'Paulo', 'Lúcia', 'Raimundo',
+         'Sebastião', 'Conceição', 'Pedro', 'Luiz', 'Marcos', 'Adriana', 'Juliana', 'Márcia', 'Fernanda', 'Rita']
+SOBRENOMES = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira', 'Alves', 'Pereira', 'Lima',
+              'Gomes', 'Costa', 'Ribeiro', 'Martins', 'Carvalho', 'Araújo', 'Melo', 'Barbosa', 'Nascimento']
+TIPOS_LOGRADOURO = ['Rua', 'Avenida', 'Travessa', 'Passagem', 'Alameda']
+
+
+def _escolher(rng, opcoes):
+    # opcoes: tuplas cujo último elemento é o peso
+    return rng.choices(opcoes, weights=[o[-1] for o in opcoes])[0]
+
+
+def gerar_logradouros(rng, quantidade):
+    # Valor do m² entre R$ 40 e R$ 600; poucas vias concentram muitos imóveis (Zipf)
+    return [
+        (f'{rng.choice(TIPOS_LOGRADOURO)} {rng.choice(SOBRENOMES)} {i}', round(rng.uniform(40, 600), 2))
+        for i in range(1, quantidade + 1)
+    ]
+
+
+def gerar_cadastros(tamanho, logradouros, bairros, semente=42, inicio=0):
+    # Gera dicionários com as colunas de CadastroReurb (sem id nem colunas calculadas)
+    rng = random.Random(semente + inicio)
+    acumulado, pesos_acumulados = 0.0, []
+    for i in range(len(logradouros)):
+        acumulado += 1.0 / (i + 1)
+        pesos_acumulados.append(acumulado)
+    for i in range(inicio, inicio + tamanho):
+        logradouro = rng.choices(logradouros, cum_weights=pesos_acumulados)[0][0]
+        padrao = _escolher(rng, PADROES)[0]
+        uso = _escolher(rng, USOS)[0]
+        area_total = round(rng.lognormvariate(5.2, 0.45), 2)  # mediana ~180 m²
+        area_construida = round(area_total * rng.uniform(0.2, 0.9), 2) if rng.random() > 0.08 else 0.0
+        yield {
+            'req_nome': f'{rng.choice(NOMES)} {rng.choice(SOBRENOMES)} {rng.choice(SOBRENOMES)}',
+            'req_cpf': f'{rng.randrange(10 ** 11):011d}',
+            'req_telefone': f'(91) 9{rng.randrange(10 ** 8):08d}',
+            'imovel_logradouro': logradouro,
+            'imovel_numero': str(rng.randint(1, 3000)),
+            'imovel_bairro': rng.choice(bairros),
+            'imovel_cidade': 'Município Exemplo',
+            'imovel_uf': 'PA',
+            'inscricao_imobiliaria': f'{i + 1:010d}',
+            'imovel_area_total': area_total,
+            'imovel_area_construida': area_construida,
+            'imovel_uso': uso,
+            'imovel_tipo_construcao': padrao,
+            'reurb_renda_familiar': round(rng.lognormvariate(7.4, 0.6), 2),
+            'tipo_reurb': _escolher(rng, TIPOS_REURB)[0],
+        }
+
+
+def popular_banco(app_module, tamanho, semente=42, lote=5000):
+    # Cria as tabelas e insere PGV + cadastros sintéticos em lotes (insert em massa)
+    db = app_module.db
+    rng = random.Random(semente)
+    logradouros = gerar_logradouros(rng, max(50, tamanho // 150))
+    bairros = [f'Bairro {n}' for n in range(1, max(10, tamanho // 2000) + 1)]
+    db.drop_all()
+    db.create_all()
+    db.session.add(app_module.Usuario(nome='Administrador', usuario='admin', senha='admin', acesso='Administrador'))
+    db.session.add_all(app_module.ValorLogradouro(logradouro=nome, valor_m2=valor) for nome, valor in logradouros)
+    db.session.add_all(app_module.PadraoConstrutivo(descricao=d, valor_m2=v) for d, v, _ in PADROES)
+    db.session.add_all(app_module.AliquotaIPTU(tipo=t, aliquota=a) for t, a, _ in USOS)
+    db.session.commit()
+
+    tabela = app_module.CadastroReurb.__table__
+    registros = []
+    for registro in gerar_cadastros(tamanho, logradouros, bairros, semente):
+        registro['req_nome_normalizado'] = app_module.normalizar_texto(registro['req_nome'])
+        registros.append(registro)
+        if len(registros) == lote:
+            db.session.execute(tabela.insert(), registros)
+            registros = []
+    if registros:
+        db.session.execute(tabela.insert(), registros)
+    app_module.CalculoTributarioService.recalcular(db.true())
+    db.session.commit()
+    return {'logradouros': logradouros, 'bairros': bairros}
+
+
+def escrever_csv(caminho, tamanho, logradouros, bairros, semente=7, inicio=10 ** 8):
+    # Planilha no formato aceito por /api/importar (cabeçalhos = nomes das colunas)
+    linhas = gerar_cadastros(tamanho, logradouros, bairros, semente, inicio)
+    primeira = next(linhas)
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=list(primeira))
+        escritor.writeheader()
+        escritor.writerow(primeira)
+        escritor.writerows(linhas)
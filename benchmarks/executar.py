@@ -0,0 +1,202 @@
+# =======================================================================
+# EXECUÇÃO DOS BENCHMARKS
+# =======================================================================
+# Monta a aplicação contra um banco local (SQLite em pasta temporária por
+# padrão, ou o PostgreSQL indicado em --banco), gera o cadastro sintético e
+# mede listagem, detalhe, gerar_iptu, estatísticas, upsert em lote, simulação da
+# PGV, importação, login e upload. O resultado em JSON inclui o commit atual,
+# para comparar execuções entre versões.
+# =======================================================================
+
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import dados_sinteticos
+
+
+def _commit_atual():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def _resumo(tempos):
+    tempos_ms = sorted(t * 1000 for t in tempos)
+    return {
+        'n': len(tempos_ms),
+        'media_ms': round(statistics.fmean(tempos_ms), 3),
+        'p50_ms': round(tempos_ms[len(tempos_ms) // 2], 3),
+        'p95_ms': round(tempos_ms[min(len(tempos_ms) - 1, int(len(tempos_ms) * 0.95))], 3),
+        'max_ms': round(tempos_ms[-1], 3),
+    }
+
+
+def _medir(funcao, repeticoes):
+    tempos = []
+    for i in range(repeticoes):
+        inicio = time.perf_counter()
+        resposta = funcao(i)
+        resposta.get_data()  # respostas em stream só são geradas ao consumir o corpo
+        tempos.append(time.perf_counter() - inicio)
+        if resposta.status_code >= 400:
+            raise RuntimeError(f'Falha no benchmark: HTTP {resposta.status_code} {resposta.get_data()[:200]!r}')
+    return _resumo(tempos)
+
+
+def carregar_app(banco, pasta):
+    os.environ['DATABASE_URL'] = banco
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import app as app_module
+    app = app_module.create_app({
+        'SQLALCHEMY_DATABASE_URI': banco,
+        'UPLOAD_FOLDER': os.path.join(pasta, 'uploads'),
+        'MINIATURAS_FOLDER': os.path.join(pasta, 'miniaturas'),
+    })
+    return app_module, app
+
+
+def executar(tamanho, banco=None, repeticoes=20, linhas_importacao=None, semente=42):
+    pasta = tempfile.mkdtemp(prefix='reurb_bench_')
+    banco = banco or 'sqlite:///' + os.path.join(pasta, 'bench.db')
+    app_module, app = carregar_app(banco, pasta)
+    rng = random.Random(semente)
+    resultados = {}
+
+    with app.app_context():
+        inicio = time.perf_counter()
+        dados = dados_sinteticos.popular_banco(app_module, tamanho, semente)
+        resultados['preparacao_banco'] = {'segundos': round(time.perf_counter() - inicio, 3)}
+
+    cliente = app.test_client()
+    token = cliente.post('/api/login', json={'usuario': 'admin', 'senha': 'admin'}).get_json()['token']
+    cabecalhos = {'Authorization': f'Bearer {token}'}
+
+    resultados['login'] = _medir(
+        lambda i: cliente.post('/api/login', json={'usuario': 'admin', 'senha': 'admin'}), repeticoes
+    )
+    resultados['listagem_primeira_pagina'] = _medir(
+        lambda i: cliente.get('/api/cadastros?limit=100', headers=cabecalhos), repeticoes
+    )
+    # Listagem completa (?stream=1 não passa pelo cache de respostas)
+    resultados['listagem_completa_stream'] = _medir(
+        lambda i: cliente.get('/api/cadastros?stream=1', headers=cabecalhos), max(1, repeticoes // 10)
+    )
+    resultados['detalhe'] = _medir(
+        lambda i: cliente.get(f'/api/cadastros/{rng.randint(1, tamanho)}', headers=cabecalhos), repeticoes
+    )
+    resultados['gerar_iptu'] = _medir(
+        lambda i: cliente.get(f'/api/gerar_iptu/{rng.randint(1, tamanho):010d}', headers=cabecalhos), repeticoes
+    )
+    # Busca e agregados sem o cache de respostas (limite de 0 bytes: nada é guardado)
+    # e, em seguida, os agregados servidos pelo cache
+    limite_cache = app.config['RESPOSTAS_CACHE_MAX_BYTES']
+    app.config['RESPOSTAS_CACHE_MAX_BYTES'] = 0
+    resultados['busca_nome'] = _medir(
+        lambda i: cliente.get(
+            f'/api/cadastros/busca?nome={rng.choice(dados_sinteticos.SOBRENOMES)}', headers=cabecalhos
+        ), repeticoes
+    )
+    resultados['estatisticas'] = _medir(
+        lambda i: cliente.get('/api/estatisticas', headers=cabecalhos), repeticoes
+    )
+    app.config['RESPOSTAS_CACHE_MAX_BYTES'] = limite_cache
+    resultados['estatisticas_cache'] = _medir(
+        lambda i: cliente.get('/api/estatisticas', headers=cabecalhos), repeticoes
+    )
+    # Correções em lote: 500 inscrições existentes atualizadas num único upsert
+    resultados['upsert_lote_500'] = _medir(
+        lambda i: cliente.post('/api/cadastros/upsert', headers=cabecalhos, json=[
+            {'inscricao_imobiliaria': f'{rng.randint(1, tamanho):010d}', 'imovel_area_total': rng.randint(80, 600)}
+            for _ in range(500)
+        ]), max(1, repeticoes // 4)
+    )
+    # Proposta de reajuste de 10% nos logradouros mais ocupados e nova alíquota residencial
+    proposta = {
+        'logradouros': {nome: round(valor * 1.1, 2) for nome, valor in dados['logradouros'][:50]},
+        'aliquotas': {'Residencial': 0.012},
+    }
+    resultados['simulacao_pgv'] = _medir(
+        lambda i: cliente.post('/api/planta_generica/simulacao', headers=cabecalhos, json=proposta), repeticoes
+    )
+
+    def enviar_documento(i):
+        conteudo = rng.randbytes(200 * 1024)
+        return cliente.post(
+            f'/api/upload_documento/{rng.randint(1, tamanho)}', headers=cabecalhos,
+            data={'file': (io.BytesIO(conteudo), f'doc_{i}.pdf'), 'tipo_documento': 'RG'},
+            content_type='multipart/form-data'
+        )
+    resultados['upload_documento'] = _medir(enviar_documento, repeticoes)
+
+    # Importação: do POST até a tarefa em segundo plano terminar
+    linhas_importacao = linhas_importacao or min(tamanho, 50000)
+    caminho_csv = os.path.join(pasta, 'importacao.csv')
+    dados_sinteticos.escrever_csv(caminho_csv, linhas_importacao, dados['logradouros'], dados['bairros'])
+    inicio = time.perf_counter()
+    with open(caminho_csv, 'rb') as arquivo:
+        resposta = cliente.post(
+            '/api/importar', headers=cabecalhos, data={'arquivo': (arquivo, 'importacao.csv')},
+            content_type='multipart/form-data'
+        )
+    tarefa_id = resposta.get_json()['tarefa_id']
+    while True:
+        tarefa = cliente.get(f'/api/jobs/{tarefa_id}', headers=cabecalhos).get_json()
+        if tarefa['status'] in ('concluida', 'erro'):
+            break
+        time.sleep(0.05)
+    duracao = time.perf_counter() - inicio
+    resultados['importacao_csv'] = {
+        'linhas': linhas_importacao,
+        'segundos': round(duracao, 3),
+        'linhas_por_segundo': round(linhas_importacao / duracao, 1),
+        'status': tarefa['status'],
+        'importados': tarefa['sucesso'],
+        'rejeitados': tarefa['falhas'],
+    }
+
+    return {
+        'commit': _commit_atual(),
+        'data': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'banco': banco.split('://', 1)[0],
+        'tamanho': tamanho,
+        'repeticoes': repeticoes,
+        'resultados': resultados,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks dos caminhos críticos da API CM REURB.')
+    parser.add_argument('--tamanho', type=int, default=10000, help='quantidade de cadastros sintéticos')
+    parser.add_argument('--banco', help='URL do banco (padrão: SQLite em pasta temporária)')
+    parser.add_argument('--repeticoes', type=int, default=20, help='repetições por cenário')
+    parser.add_argument('--linhas-importacao', type=int, help='linhas do CSV importado (padrão: min(tamanho, 50000))')
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--saida', help='arquivo JSON de saída (padrão: stdout)')
+    args = parser.parse_args(argv)
+
+    resultado = executar(args.tamanho, args.banco, args.repeticoes, args.linhas_importacao, args.semente)
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+    else:
+        print(texto)
+
+
+if __name__ == '__main__':
+    main()
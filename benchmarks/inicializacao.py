@@ -0,0 +1,82 @@
+# =======================================================================
+# BENCHMARK DE INICIALIZAÇÃO DO WORKER
+# =======================================================================
+# Cada medição roda num processo Python novo, como um worker do gunicorn:
+# tempo de import do módulo, de create_app() e da primeira requisição, memória
+# residente (RSS) ao final e quais bibliotecas pesadas já estavam carregadas.
+# Para referência, mede também o RSS depois de importar pandas, o custo que o
+# worker só paga quando uma importação/simulação é de fato executada.
+# =======================================================================
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CODIGO_MEDICAO = r'''
+import json, sys, time
+
+def rss_mb():
+    try:
+        with open('/proc/self/status') as status:
+            for linha in status:
+                if linha.startswith('VmRSS:'):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maximo / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+resultado = {'rss_inicial_mb': rss_mb()}
+inicio = time.perf_counter()
+import app as app_module
+resultado['import_s'] = time.perf_counter() - inicio
+inicio = time.perf_counter()
+app = app_module.create_app({'SQLALCHEMY_DATABASE_URI': sys.argv[1], 'UPLOAD_FOLDER': sys.argv[2]})
+resultado['create_app_s'] = time.perf_counter() - inicio
+inicio = time.perf_counter()
+app.test_client().get('/metrics')
+resultado['primeira_requisicao_s'] = time.perf_counter() - inicio
+resultado['rss_mb'] = rss_mb()
+resultado['modulos_carregados'] = sorted(m for m in ('pandas', 'numpy', 'openpyxl', 'PIL') if m in sys.modules)
+import pandas
+resultado['rss_com_pandas_mb'] = rss_mb()
+print(json.dumps(resultado))
+'''
+
+
+def medir(repeticoes=5):
+    pasta = tempfile.mkdtemp(prefix='reurb_inicio_')
+    banco = 'sqlite:///' + os.path.join(pasta, 'inicio.db')
+    ambiente = dict(os.environ, PYTHONPATH=RAIZ, DATABASE_URL=banco)
+    amostras = []
+    for _ in range(repeticoes):
+        saida = subprocess.check_output(
+            [sys.executable, '-c', CODIGO_MEDICAO, banco, os.path.join(pasta, 'uploads')],
+            env=ambiente, cwd=pasta, text=True
+        )
+        amostras.append(json.loads(saida.strip().splitlines()[-1]))
+
+    resultado = {'repeticoes': repeticoes, 'modulos_carregados': amostras[-1]['modulos_carregados']}
+    for nome in ('import_s', 'create_app_s', 'primeira_requisicao_s'):
+        resultado[nome.replace('_s', '_ms')] = round(statistics.median(a[nome] for a in amostras) * 1000, 1)
+    for nome in ('rss_inicial_mb', 'rss_mb', 'rss_com_pandas_mb'):
+        resultado[nome] = round(statistics.median(a[nome] for a in amostras), 1)
+    return resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Tempo de inicialização e memória de um worker da API CM REURB.')
+    parser.add_argument('--repeticoes', type=int, default=5, help='processos medidos (mediana)')
+    args = parser.parse_args(argv)
+    print(json.dumps(medir(args.repeticoes), indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
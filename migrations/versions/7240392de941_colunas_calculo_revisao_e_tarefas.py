@@ -0,0 +1,112 @@
+"""Colunas de valores calculados, revisões de sincronização e tabelas auxiliares
+
+Adiciona a cadastros_reurb os valores tributários persistidos, a revisão e o
+nome normalizado; a documentos o hash do conteúdo, o tamanho e a revisão; e cria
+versoes_tabelas, tarefas e registros_excluidos.
+
+Depois de aplicar, preencha os dados derivados dos registros existentes:
+    flask normalizar-nomes
+    flask recalcular-valores
+
+Revision ID: 7240392de941
+Revises: df120cfa5880
+Create Date: 2026-10-17 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7240392de941'
+down_revision = 'df120cfa5880'
+branch_labels = None
+depends_on = None
+
+
+# Colunas que o código anterior às migrações já usava sem declarar no modelo:
+# alguns bancos já as têm, então só são criadas quando ausentes.
+COLUNAS_LEGADAS = ('tipo_reurb', 'data_criacao', 'data_atualizacao')
+
+
+def _colunas(tabela):
+    return {coluna['name'] for coluna in sa.inspect(op.get_bind()).get_columns(tabela)}
+
+
+def upgrade():
+    existentes = _colunas('cadastros_reurb')
+    with op.batch_alter_table('cadastros_reurb') as batch_op:
+        if 'tipo_reurb' not in existentes:
+            batch_op.add_column(sa.Column('tipo_reurb', sa.String(length=30), nullable=True))
+        if 'data_criacao' not in existentes:
+            batch_op.add_column(sa.Column('data_criacao', sa.DateTime(), nullable=True))
+        if 'data_atualizacao' not in existentes:
+            batch_op.add_column(sa.Column('data_atualizacao', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('req_nome_normalizado', sa.String(length=150), nullable=True))
+        batch_op.add_column(sa.Column('vvt', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('vvc', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('vvi', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('iptu', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('valores_calculados_em', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('revisao', sa.BigInteger(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('documentos') as batch_op:
+        batch_op.add_column(sa.Column('hash_sha256', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('tamanho_bytes', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('revisao', sa.BigInteger(), server_default='0', nullable=False))
+
+    op.create_table(
+        'versoes_tabelas',
+        sa.Column('nome', sa.String(length=50), nullable=False),
+        sa.Column('versao', sa.Integer(), nullable=False),
+        sa.Column('atualizado_em', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('nome')
+    )
+    op.create_table(
+        'tarefas',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('tipo', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('usuario_id', sa.Integer(), nullable=True),
+        sa.Column('processados', sa.Integer(), nullable=False),
+        sa.Column('sucesso', sa.Integer(), nullable=False),
+        sa.Column('falhas', sa.Integer(), nullable=False),
+        sa.Column('resultado', sa.Text(), nullable=True),
+        sa.Column('erro', sa.Text(), nullable=True),
+        sa.Column('criado_em', sa.DateTime(), nullable=True),
+        sa.Column('iniciado_em', sa.DateTime(), nullable=True),
+        sa.Column('concluido_em', sa.DateTime(), nullable=True),
+        sa.Column('dono', sa.String(length=120), nullable=True),
+        sa.Column('heartbeat_em', sa.DateTime(), nullable=True),
+        sa.Column('arquivo_temporario', sa.String(length=500), nullable=True),
+        sa.ForeignKeyConstraint(['usuario_id'], ['usuarios.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'registros_excluidos',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('tabela', sa.String(length=30), nullable=False),
+        sa.Column('registro_id', sa.Integer(), nullable=False),
+        sa.Column('revisao', sa.BigInteger(), nullable=False),
+        sa.Column('excluido_em', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('registros_excluidos')
+    op.drop_table('tarefas')
+    op.drop_table('versoes_tabelas')
+    with op.batch_alter_table('documentos') as batch_op:
+        batch_op.drop_column('revisao')
+        batch_op.drop_column('tamanho_bytes')
+        batch_op.drop_column('hash_sha256')
+    # As colunas legadas (tipo_reurb, data_criacao, data_atualizacao) são mantidas
+    with op.batch_alter_table('cadastros_reurb') as batch_op:
+        batch_op.drop_column('revisao')
+        batch_op.drop_column('valores_calculados_em')
+        batch_op.drop_column('iptu')
+        batch_op.drop_column('vvi')
+        batch_op.drop_column('vvc')
+        batch_op.drop_column('vvt')
+        batch_op.drop_column('req_nome_normalizado')
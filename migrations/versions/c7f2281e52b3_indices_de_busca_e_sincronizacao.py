@@ -0,0 +1,75 @@
+"""Índices de busca, de sincronização e índice único da inscrição imobiliária
+
+Cria a extensão pg_trgm (PostgreSQL) para o índice GIN de busca por trecho do
+nome e os índices B-tree de /api/cadastros/busca, /api/sync e das tarefas.
+O índice único em inscricao_imobiliaria falha se houver inscrições repetidas:
+a migração verifica antes e lista as duplicadas para correção manual.
+
+Revision ID: c7f2281e52b3
+Revises: 7240392de941
+Create Date: 2026-10-17 09:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7f2281e52b3'
+down_revision = '7240392de941'
+branch_labels = None
+depends_on = None
+
+
+def _verificar_inscricoes_duplicadas():
+    duplicadas = op.get_bind().execute(sa.text(
+        'SELECT inscricao_imobiliaria, COUNT(*) AS total FROM cadastros_reurb '
+        'WHERE inscricao_imobiliaria IS NOT NULL '
+        'GROUP BY inscricao_imobiliaria HAVING COUNT(*) > 1 '
+        'ORDER BY total DESC LIMIT 20'
+    )).all()
+    if duplicadas:
+        exemplos = ', '.join(f'{inscricao!r} ({total}x)' for inscricao, total in duplicadas)
+        raise RuntimeError(
+            'Existem cadastros com a mesma inscricao_imobiliaria; corrija-os (ou limpe '
+            f'as inscrições repetidas) antes de criar o índice único. Exemplos: {exemplos}'
+        )
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    _verificar_inscricoes_duplicadas()
+    with op.batch_alter_table('cadastros_reurb') as batch_op:
+        batch_op.create_index('ix_cadastros_reurb_inscricao_imobiliaria', ['inscricao_imobiliaria'], unique=True)
+        batch_op.create_index('ix_cadastros_reurb_req_cpf', ['req_cpf'], unique=False)
+        batch_op.create_index('ix_cadastros_reurb_imovel_bairro', ['imovel_bairro'], unique=False)
+        batch_op.create_index('ix_cadastros_reurb_imovel_logradouro', ['imovel_logradouro'], unique=False)
+        batch_op.create_index(
+            'ix_cadastros_reurb_req_nome_normalizado', ['req_nome_normalizado'], unique=False,
+            postgresql_using='gin', postgresql_ops={'req_nome_normalizado': 'gin_trgm_ops'}
+        )
+        batch_op.create_index('ix_cadastros_reurb_revisao_id', ['revisao', 'id'], unique=False)
+
+    with op.batch_alter_table('documentos') as batch_op:
+        batch_op.create_index('ix_documentos_hash_sha256', ['hash_sha256'], unique=False)
+        batch_op.create_index('ix_documentos_revisao_id', ['revisao', 'id'], unique=False)
+
+    op.create_index('ix_tarefas_status_heartbeat', 'tarefas', ['status', 'heartbeat_em'], unique=False)
+    op.create_index('ix_registros_excluidos_revisao_id', 'registros_excluidos', ['revisao', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_registros_excluidos_revisao_id', table_name='registros_excluidos')
+    op.drop_index('ix_tarefas_status_heartbeat', table_name='tarefas')
+    with op.batch_alter_table('documentos') as batch_op:
+        batch_op.drop_index('ix_documentos_revisao_id')
+        batch_op.drop_index('ix_documentos_hash_sha256')
+    with op.batch_alter_table('cadastros_reurb') as batch_op:
+        batch_op.drop_index('ix_cadastros_reurb_revisao_id')
+        batch_op.drop_index('ix_cadastros_reurb_req_nome_normalizado')
+        batch_op.drop_index('ix_cadastros_reurb_imovel_logradouro')
+        batch_op.drop_index('ix_cadastros_reurb_imovel_bairro')
+        batch_op.drop_index('ix_cadastros_reurb_req_cpf')
+        batch_op.drop_index('ix_cadastros_reurb_inscricao_imobiliaria')
@@ -0,0 +1,128 @@
+"""Esquema inicial (tabelas anteriores às migrações)
+
+Bancos já existentes, criados com db.create_all() antes desta pasta de
+migrações, devem ser marcados com 'flask db stamp df120cfa5880' e depois
+atualizados com 'flask db upgrade'.
+
+Revision ID: df120cfa5880
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'df120cfa5880'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'usuarios',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('nome', sa.String(length=100), nullable=False),
+        sa.Column('usuario', sa.String(length=50), nullable=False),
+        sa.Column('senha_hash', sa.String(length=1024), nullable=False),
+        sa.Column('acesso', sa.String(length=20), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('usuario')
+    )
+    op.create_table(
+        'cadastros_reurb',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('req_nome', sa.String(length=150), nullable=True),
+        sa.Column('req_cpf', sa.String(length=20), nullable=True),
+        sa.Column('req_rg', sa.String(length=20), nullable=True),
+        sa.Column('req_data_nasc', sa.String(length=20), nullable=True),
+        sa.Column('req_nacionalidade', sa.String(length=50), nullable=True),
+        sa.Column('req_estado_civil', sa.String(length=30), nullable=True),
+        sa.Column('conj_nome', sa.String(length=150), nullable=True),
+        sa.Column('conj_cpf', sa.String(length=20), nullable=True),
+        sa.Column('req_profissao', sa.String(length=100), nullable=True),
+        sa.Column('req_telefone', sa.String(length=30), nullable=True),
+        sa.Column('req_email', sa.String(length=150), nullable=True),
+        sa.Column('req_cep_atual', sa.String(length=15), nullable=True),
+        sa.Column('req_logradouro_atual', sa.String(length=150), nullable=True),
+        sa.Column('req_numero_atual', sa.String(length=20), nullable=True),
+        sa.Column('req_complemento_atual', sa.String(length=100), nullable=True),
+        sa.Column('req_bairro_atual', sa.String(length=100), nullable=True),
+        sa.Column('req_cidade_atual', sa.String(length=100), nullable=True),
+        sa.Column('req_uf_atual', sa.String(length=2), nullable=True),
+        sa.Column('imovel_cep', sa.String(length=15), nullable=True),
+        sa.Column('imovel_logradouro', sa.String(length=150), nullable=True),
+        sa.Column('imovel_numero', sa.String(length=20), nullable=True),
+        sa.Column('imovel_complemento', sa.String(length=100), nullable=True),
+        sa.Column('imovel_bairro', sa.String(length=100), nullable=True),
+        sa.Column('imovel_cidade', sa.String(length=100), nullable=True),
+        sa.Column('imovel_uf', sa.String(length=2), nullable=True),
+        sa.Column('inscricao_imobiliaria', sa.String(length=30), nullable=True),
+        sa.Column('imovel_area_total', sa.Float(), nullable=True),
+        sa.Column('imovel_area_construida', sa.Float(), nullable=True),
+        sa.Column('imovel_uso', sa.String(length=30), nullable=True),
+        sa.Column('imovel_tipo_construcao', sa.String(length=30), nullable=True),
+        sa.Column('imovel_data_ocupacao', sa.String(length=20), nullable=True),
+        sa.Column('imovel_forma_ocupacao', sa.Text(), nullable=True),
+        sa.Column('imovel_docs_posse', sa.Text(), nullable=True),
+        sa.Column('imovel_fotos', sa.Text(), nullable=True),
+        sa.Column('imovel_croqui', sa.Text(), nullable=True),
+        sa.Column('confrontante_ld', sa.String(length=200), nullable=True),
+        sa.Column('confrontante_le', sa.String(length=200), nullable=True),
+        sa.Column('confrontante_fundo', sa.String(length=200), nullable=True),
+        sa.Column('confrontante_frente', sa.String(length=200), nullable=True),
+        sa.Column('reurb_finalidade_moradia', sa.String(length=50), nullable=True),
+        sa.Column('reurb_renda_familiar', sa.Float(), nullable=True),
+        sa.Column('reurb_propriedade', sa.String(length=30), nullable=True),
+        sa.Column('reurb_infra_necessaria', sa.String(length=30), nullable=True),
+        sa.Column('reurb_riscos', sa.String(length=30), nullable=True),
+        sa.Column('reurb_riscos_descricao', sa.Text(), nullable=True),
+        sa.Column('reurb_outro_imovel', sa.String(length=10), nullable=True),
+        sa.Column('reurb_cadunico', sa.String(length=10), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'documentos',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('cadastro_id', sa.Integer(), nullable=False),
+        sa.Column('nome_arquivo', sa.String(length=255), nullable=False),
+        sa.Column('path_arquivo', sa.String(length=512), nullable=False),
+        sa.Column('tipo_documento', sa.String(length=100), nullable=True),
+        sa.Column('data_upload', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['cadastro_id'], ['cadastros_reurb.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'padroes_construtivos',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('descricao', sa.String(length=150), nullable=False),
+        sa.Column('valor_m2', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'valores_logradouro',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('logradouro', sa.String(length=150), nullable=False),
+        sa.Column('valor_m2', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('logradouro')
+    )
+    op.create_table(
+        'aliquotas_iptu',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('tipo', sa.String(length=150), nullable=False),
+        sa.Column('aliquota', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('tipo')
+    )
+
+
+def downgrade():
+    op.drop_table('aliquotas_iptu')
+    op.drop_table('valores_logradouro')
+    op.drop_table('padroes_construtivos')
+    op.drop_table('documentos')
+    op.drop_table('cadastros_reurb')
+    op.drop_table('usuarios')